@@ -19,82 +19,191 @@ Flow:
 import time
 import os
 import re
+import json
 import argparse
+import difflib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import pandas as pd
-from datetime import datetime
+import requests
+import requests_cache
+from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+import httpx
 from supabase import create_client
+from supabase.client import ClientOptions
 from dotenv import load_dotenv
 
+try:  # Optional: 2-3x faster JSON parsing when installed
+    import orjson as _json
+except ImportError:
+    _json = json
+
 load_dotenv()
 
 SUPABASE_URL = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
 SUPABASE_KEY = os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Shared pooled HTTP client so repeated Supabase calls reuse one TLS connection
+# instead of re-handshaking per request.
+_http_client = httpx.Client(
+    limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+)
+supabase = create_client(
+    SUPABASE_URL, SUPABASE_KEY, options=ClientOptions(httpx_client=_http_client)
+)
 
 
-def get_latest_pga_tournament(driver) -> tuple[int, int] | None:
-    """Scrape past-results page to find most recent completed PGA tournament (by date)."""
-    driver.get("https://datagolf.com/past-results/pga-tour")
-    time.sleep(5)
-    
-    html = driver.page_source
-    matches = re.findall(r"/past-results/pga-tour/(\d+)/(\d{4})", html)
+_EVENT_RE = re.compile(r"/past-results/pga-tour/(\d+)/(\d{4})")
+_RELOAD_DATA_RE = re.compile(r"reload_data\s*=\s*(\{.*?\});", re.S)
+
+# Past-results pages embed reload_data inline in a <script> tag, so they can be
+# fetched over plain HTTP - no browser needed. Cache responses for a day so
+# reruns (and the candidate scan) are near-free.
+_dg_session = requests_cache.CachedSession(".dg_cache", expire_after=86400)
+_dg_session.headers["User-Agent"] = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def fetch_reload_data(url: str) -> dict | None:
+    """GET a datagolf page and parse the inline reload_data JS object."""
+    try:
+        resp = _dg_session.get(url, timeout=15)
+        resp.raise_for_status()
+    except requests.RequestException:
+        return None
+    m = _RELOAD_DATA_RE.search(resp.text)
+    if not m:
+        return None
+    try:
+        return _json.loads(m.group(1))
+    except ValueError:
+        return None
+
+
+def _event_date(rd: dict | None) -> str | None:
+    """Pull the tournament date out of a reload_data object, if it has results."""
+    if not rd or not rd.get("lb"):
+        return None
+    info = rd.get("info")
+    if isinstance(info, list):
+        info = info[0] if info else None
+    return info.get("date") if info else None
+
+
+def safe_get(driver, url: str) -> None:
+    """Navigate, treating a page-load timeout as success.
+
+    With the eager load strategy + short page_load_timeout, slow trackers can
+    still trip the timeout; the WebDriverWait that follows each navigation
+    checks for the data we actually need.
+    """
+    try:
+        driver.get(url)
+    except TimeoutException:
+        pass
+
+
+def get_latest_pga_tournament() -> tuple[int, int] | None:
+    """Scan past-results pages to find most recent completed PGA tournament (by date)."""
+    try:
+        resp = _dg_session.get("https://datagolf.com/past-results/pga-tour", timeout=15)
+        resp.raise_for_status()
+    except requests.RequestException:
+        return None
+
+    matches = _EVENT_RE.findall(resp.text)
     seen = set()
     candidates = []
     for e, y in matches:
         if int(y) >= 2024 and (e, y) not in seen:
             seen.add((e, y))
             candidates.append((int(e), int(y)))
-    
+
     # Fetch date for each candidate, keep only those with results; sort by date desc
-    today = datetime.now().strftime("%Y-%m-%d")
-    with_dates = []
-    for event_id, year in candidates[:15]:  # Check recent candidates
-        url = f"https://datagolf.com/past-results/pga-tour/{event_id}/{year}"
-        driver.get(url)
-        time.sleep(3)
-        result = driver.execute_script("""
-            let rd = window.reload_data;
-            if (!rd || !rd.lb || rd.lb.length === 0) return null;
-            let info = rd.info;
-            if (Array.isArray(info)) info = info[0];
-            return info ? info.date : null;
-        """)
-        if result:
-            with_dates.append((event_id, year, result))
-    
+    def fetch_date(candidate: tuple[int, int]) -> tuple[int, int, str] | None:
+        event_id, year = candidate
+        date = _event_date(
+            fetch_reload_data(f"https://datagolf.com/past-results/pga-tour/{event_id}/{year}")
+        )
+        return (event_id, year, date) if date else None
+
+    # The candidate pages are independent GETs - fetch them concurrently
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = ex.map(fetch_date, candidates[:15])  # Check recent candidates
+    with_dates = [r for r in results if r]
+
+    if not with_dates and candidates:
+        # The inline parse may have failed site-wide (e.g. the page layout
+        # changed) - rescan the candidates through one browser before giving up
+        driver = make_driver()
+        try:
+            for event_id, year in candidates[:15]:
+                date = _event_date(_read_reload_data(
+                    driver, f"https://datagolf.com/past-results/pga-tour/{event_id}/{year}"
+                ))
+                if date:
+                    with_dates.append((event_id, year, date))
+        finally:
+            driver.quit()
+
     if not with_dates:
         return None
-    
-    # Sort by tournament date descending (most recent first)
+
+    # Sort by tournament date descending (most recent first); parse all the
+    # date strings in one pass so non-ISO formats still order chronologically
+    parsed = pd.to_datetime([d for _, _, d in with_dates], errors="coerce")
+    ranked = [(e, y, ts) for (e, y, _), ts in zip(with_dates, parsed) if not pd.isna(ts)]
+    if ranked:
+        ranked.sort(key=lambda x: x[2], reverse=True)
+        return (ranked[0][0], ranked[0][1])
+
+    # Nothing parsed - fall back to the raw string ordering
     with_dates.sort(key=lambda x: x[2], reverse=True)
     return (with_dates[0][0], with_dates[0][1])
 
 
-def fetch_field_from_past_results(driver, event_id: int, year: int) -> tuple[list[str], dict] | None:
+def _read_reload_data(driver, url: str) -> dict | None:
+    """Read reload_data from a page through an existing browser."""
+    safe_get(driver, url)
+    try:
+        WebDriverWait(driver, 15).until(
+            lambda d: d.execute_script("return !!(window.reload_data && window.reload_data.lb)")
+        )
+    except TimeoutException:
+        return None
+    raw = driver.execute_script("return JSON.stringify(window.reload_data || null);")
+    return _json.loads(raw) if raw else None
+
+
+def _fetch_reload_data_selenium(url: str) -> dict | None:
+    """Last-resort fallback: read reload_data through a browser, for when the
+    inline <script> parse fails (e.g. the page layout changes)."""
+    driver = make_driver()
+    try:
+        return _read_reload_data(driver, url)
+    finally:
+        driver.quit()
+
+
+def fetch_field_from_past_results(event_id: int, year: int) -> tuple[list[str], dict] | None:
     """Fetch full field and tournament info from past-results page."""
     url = f"https://datagolf.com/past-results/pga-tour/{event_id}/{year}"
-    driver.get(url)
-    time.sleep(5)
-    
-    data = driver.execute_script("""
-        let rd = window.reload_data;
-        if (!rd || !rd.lb) return null;
-        return {
-            players: rd.lb.map(p => ({ player_name: p.player_name })),
-            info: rd.info,
-            course: rd.course
-        };
-    """)
-    
-    if not data or not data.get("players"):
+    rd = fetch_reload_data(url)
+    if not rd or not rd.get("lb"):
+        rd = _fetch_reload_data_selenium(url)
+    if not rd or not rd.get("lb"):
         return None
-    
+
     players = []
-    for row in data["players"]:
+    for row in rd["lb"]:
         name = row.get("player_name", "")
         if "," in name:
             last, first = name.split(",", 1)
@@ -102,7 +211,7 @@ def fetch_field_from_past_results(driver, event_id: int, year: int) -> tuple[lis
         else:
             players.append(name.strip())
     
-    info = data.get("info") or {}
+    info = rd.get("info") or {}
     if isinstance(info, list):
         info = info[0] if info else {}
     
@@ -114,62 +223,130 @@ def fetch_field_from_past_results(driver, event_id: int, year: int) -> tuple[lis
     return (players, tournament)
 
 
-def get_player_id(name: str) -> str | None:
-    r = supabase.table("pga_players").select("id").eq("name", name).execute()
-    if r.data:
-        return r.data[0]["id"]
-    last = name.split()[-1]
-    r = supabase.table("pga_players").select("id, name").ilike("name", f"%{last}%").execute()
-    for p in r.data or []:
-        if last.lower() == p["name"].split()[-1].lower():
-            return p["id"]
-    return None
+def load_player_index() -> tuple[dict, dict, dict, set]:
+    """Fetch pga_players once and build lookup dicts (exact name + last name,
+    plus id -> DB name), plus the set of player IDs whose skill profile is
+    less than 6 days old."""
+    all_players = (
+        supabase.table("pga_players").select("id,name,skills_updated_at").execute().data or []
+    )
+    by_name = {p["name"].lower(): p["id"] for p in all_players}
+    name_by_id = {p["id"]: p["name"] for p in all_players}
+    by_last = defaultdict(list)
+    for p in all_players:
+        by_last[p["name"].split()[-1].lower()].append(p)
 
+    cutoff = datetime.utcnow() - timedelta(days=6)
+    fresh_skills = set()
+    for p in all_players:
+        ts = p.get("skills_updated_at")
+        if not ts:
+            continue
+        try:
+            updated = datetime.fromisoformat(ts.replace("Z", "+00:00")).replace(tzinfo=None)
+        except ValueError:
+            continue
+        if updated >= cutoff:
+            fresh_skills.add(p["id"])
+    return by_name, by_last, name_by_id, fresh_skills
 
-def scrape_player(driver, name: str) -> dict | None:
-    driver.get("https://datagolf.com/player-profiles")
-    time.sleep(3)
-    
+
+def get_player_id(name: str, by_name: dict, by_last: dict) -> str | None:
+    name = NAME_ALIASES.get(name, name)
+    lowered = name.lower()
+    pid = by_name.get(lowered)
+    if pid:
+        return pid
+    for p in by_last.get(name.rsplit(" ", 1)[-1].lower(), []):
+        return p["id"]
+    # Last resort: fuzzy match against all known names - catches small
+    # spelling differences the alias table doesn't cover
+    close = difflib.get_close_matches(lowered, by_name.keys(), n=1, cutoff=0.85)
+    return by_name[close[0]] if close else None
+
+
+def _find_search_input(driver):
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text']"))
+        )
+    except TimeoutException:
+        return None
     inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='text']")
-    search = next((inp for inp in inputs if inp.is_displayed()), None)
+    return next((inp for inp in inputs if inp.is_displayed()), None)
+
+
+def scrape_player(driver, name: str) -> dict | None:
+    # The profiles page is an SPA: load it once per driver, then re-search in
+    # place for each subsequent player instead of paying a full reload.
+    if "player-profiles" not in driver.current_url:
+        safe_get(driver, "https://datagolf.com/player-profiles")
+
+    search = _find_search_input(driver)
     if not search:
-        return None
-    
+        # Page may have navigated away or gone stale - one hard reload
+        safe_get(driver, "https://datagolf.com/player-profiles")
+        search = _find_search_input(driver)
+        if not search:
+            return None
+
+    search.send_keys(Keys.CONTROL, "a")
+    search.send_keys(Keys.DELETE)
+    # Clear the previous player's data so the readiness wait below can't
+    # succeed on stale objects
+    driver.execute_script("window.new_data = null; window.reload_data = null;")
     search.send_keys(name)
-    time.sleep(2)
-    
-    last = name.split()[-1].lower()
-    items = driver.find_elements(By.CSS_SELECTOR, ".ui-menu-item")
-    for item in items:
-        try:
-            if item.is_displayed() and last in item.text.lower():
-                item.click()
-                break
-        except Exception:
-            pass
-    
-    time.sleep(4)
-    
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, ".ui-menu-item"))
+        )
+    except TimeoutException:
+        return None  # No autocomplete match for this name
+
+    last = name.rsplit(" ", 1)[-1].lower()
+    # Match and click entirely in the page - one RPC instead of several per
+    # autocomplete item
+    clicked = driver.execute_script("""
+        const last = arguments[0];
+        for (const e of document.querySelectorAll('.ui-menu-item')) {
+            if (e.offsetParent && e.textContent.toLowerCase().includes(last)) {
+                e.click();
+                return true;
+            }
+        }
+        return false;
+    """, last)
+    if not clicked:
+        return None
+
+    try:
+        WebDriverWait(driver, 10).until(
+            lambda d: d.execute_script("return !!window.new_data && !!window.reload_data")
+        )
+    except TimeoutException:
+        return None
+
     if last not in driver.title.lower():
         return None
     
-    return driver.execute_script("""
-        return {
+    # Return one JSON string and parse it in Python - WebDriver's own deep
+    # serialization marshals large nested arrays element-by-element
+    raw = driver.execute_script("""
+        return JSON.stringify({
             new_data: window.new_data || [],
             reload_data: window.reload_data || null
-        };
+        });
     """)
+    return _json.loads(raw) if raw else None
 
 
 def process_tournament_records(new_data: list, pga_id: str) -> list[dict]:
     if not new_data:
         return []
     df = pd.DataFrame(new_data)
-    for col in ["total", "ott", "app", "arg", "putt"]:
-        if col in df.columns:
-            df[col] = df[col].apply(
-                lambda x: None if x is None or (isinstance(x, (int, float)) and x <= -9000) else x
-            )
+    # Data Golf uses <= -9000 as a "no data" sentinel in the SG columns
+    sg_src = [c for c in ["total", "ott", "app", "arg", "putt"] if c in df.columns]
+    df[sg_src] = df[sg_src].apply(pd.to_numeric, errors="coerce").mask(lambda x: x <= -9000)
     
     agg = df.groupby(["event_name", "date"]).agg({
         "course_name": "first",
@@ -182,30 +359,45 @@ def process_tournament_records(new_data: list, pga_id: str) -> list[dict]:
         "putt": "mean",
         "round_score": "sum",
     }).reset_index()
-    
-    records = []
-    for _, row in agg.iterrows():
-        try:
-            dt = datetime.strptime(row["date"], "%b %d, %Y")
-            tournament_date = dt.strftime("%Y-%m-%d")
-        except Exception:
-            continue
-        
-        records.append({
-            "pga_player_id": pga_id,
-            "tournament_name": row["event_name"],
-            "course_name": row["course_name"] or "",
-            "tournament_date": tournament_date,
-            "finish_position": int(row["fin_numeric"]) if pd.notna(row["fin_numeric"]) and row["fin_numeric"] < 900 else None,
-            "is_made_cut": row["fin_text"] not in ["CUT", "WD", "DQ", "MDF"],
-            "total_score": int(row["round_score"]) if pd.notna(row["round_score"]) else None,
-            "strokes_gained_total": round(float(row["total"]), 3) if pd.notna(row["total"]) else None,
-            "strokes_gained_putting": round(float(row["putt"]), 3) if pd.notna(row["putt"]) else None,
-            "strokes_gained_approach": round(float(row["app"]), 3) if pd.notna(row["app"]) else None,
-            "strokes_gained_around_green": round(float(row["arg"]), 3) if pd.notna(row["arg"]) else None,
-            "strokes_gained_off_tee": round(float(row["ott"]), 3) if pd.notna(row["ott"]) else None,
-        })
-    return records
+
+    # Vectorized transform to the historical_tournament_results schema
+    agg["tournament_date"] = pd.to_datetime(agg["date"], format="%b %d, %Y", errors="coerce")
+    agg = agg[agg["tournament_date"].notna()].copy()
+    if agg.empty:
+        return []
+    agg["tournament_date"] = agg["tournament_date"].dt.strftime("%Y-%m-%d")
+
+    agg["pga_player_id"] = pga_id
+    agg["course_name"] = agg["course_name"].fillna("")
+    # All-null input leaves these columns as object dtype, where comparison
+    # and round() raise - coerce numeric first, like the SG columns above
+    agg["fin_numeric"] = pd.to_numeric(agg["fin_numeric"], errors="coerce")
+    agg["round_score"] = pd.to_numeric(agg["round_score"], errors="coerce")
+    agg["finish_position"] = agg["fin_numeric"].where(agg["fin_numeric"] < 900).astype("Int64")
+    agg["is_made_cut"] = ~agg["fin_text"].isin(["CUT", "WD", "DQ", "MDF"])
+    agg["total_score"] = agg["round_score"].round().astype("Int64")
+
+    agg = agg.rename(columns={
+        "event_name": "tournament_name",
+        "total": "strokes_gained_total",
+        "putt": "strokes_gained_putting",
+        "app": "strokes_gained_approach",
+        "arg": "strokes_gained_around_green",
+        "ott": "strokes_gained_off_tee",
+    })
+    sg_cols = [
+        "strokes_gained_total", "strokes_gained_putting", "strokes_gained_approach",
+        "strokes_gained_around_green", "strokes_gained_off_tee",
+    ]
+    agg[sg_cols] = agg[sg_cols].round(3)
+
+    out_cols = [
+        "pga_player_id", "tournament_name", "course_name", "tournament_date",
+        "finish_position", "is_made_cut", "total_score",
+    ] + sg_cols
+    # Round-trip through JSON so NaN/NA become null and numpy scalars become
+    # plain Python types, matching what the old row loop emitted
+    return _json.loads(agg[out_cols].to_json(orient="records"))
 
 
 def process_skills(reload_data: dict | None) -> dict | None:
@@ -292,6 +484,87 @@ def load_players_from_tournament(tournament_id: str) -> list[str] | None:
     return players if players else None
 
 
+def make_driver(worker_idx: int | None = None):
+    """Build a headless Chrome driver with the tuned navigation settings."""
+    opts = Options()
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--window-size=1920,1080")
+    opts.add_argument("--headless")
+    if worker_idx is not None:
+        # Parallel workers need separate profile dirs to avoid corruption
+        opts.add_argument(f"--user-data-dir=/tmp/chrome-{os.getpid()}-{worker_idx}")
+    # Don't wait for the full load event (third-party trackers etc.) - the
+    # WebDriverWait checks poll for the specific JS objects we actually need.
+    opts.page_load_strategy = "eager"
+    driver = webdriver.Chrome(options=opts)
+    driver.set_page_load_timeout(8)
+    # We only read window.new_data/reload_data (populated by first-party JS),
+    # so block images, fonts, stylesheets, and trackers to cut network time.
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff*", "*.css",
+        "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+        "*facebook*", "*hotjar*",
+    ]})
+    return driver
+
+
+def scrape_worker(worker_idx: int, assignments: list[tuple[str, str]]) -> list[dict]:
+    """Scrape a subset of players in a dedicated Chrome (runs in a worker process).
+
+    Only scraping and processing happen here; all Supabase writes stay in the
+    main process to avoid multi-client contention.
+    """
+    driver = make_driver(worker_idx)
+    results = []
+    try:
+        for name, pid in assignments:
+            try:
+                data = scrape_player(driver, name)
+            except Exception:
+                # A flaky page/driver hiccup on one player shouldn't cost the
+                # rest of this worker's subset
+                data = None
+            if not data:
+                results.append({"name": name, "pid": pid, "scraped": False,
+                                "records": [], "skills": None})
+                continue
+            results.append({
+                "name": name,
+                "pid": pid,
+                "scraped": True,
+                "records": process_tournament_records(data.get("new_data", []), pid),
+                "skills": process_skills(data.get("reload_data")),
+            })
+            time.sleep(1)
+    finally:
+        driver.quit()
+    return results
+
+
+def flush_writes(pending_records: list, pending_skills: list) -> None:
+    """Bulk-write accumulated tournament records and skill updates, then clear."""
+    if pending_records:
+        try:
+            supabase.table("historical_tournament_results").upsert(
+                pending_records,
+                on_conflict="pga_player_id,tournament_name,tournament_date",
+            ).execute()
+        except Exception as e:
+            if "on_conflict" in str(e).lower():
+                supabase.table("historical_tournament_results").upsert(pending_records).execute()
+            else:
+                print(f"⚠️ Record upsert failed: {e}", flush=True)
+        pending_records.clear()
+    if pending_skills:
+        try:
+            supabase.table("pga_players").upsert(pending_skills).execute()
+        except Exception as e:
+            print(f"⚠️ Skills upsert failed: {e}", flush=True)
+        pending_skills.clear()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Weekly update: tournament results + SG + skills")
     parser.add_argument("--tournament-id", type=str, help="Tournament UUID - use field from tournament_players (odds import)")
@@ -299,28 +572,21 @@ def main():
     parser.add_argument("--year", type=int, default=datetime.now().year)
     parser.add_argument("--field-file", type=str, help="CSV file with Player in first column (fallback)")
     parser.add_argument("--latest", action="store_true", help="Auto-detect most recent tournament")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel Chrome workers for scraping")
     args = parser.parse_args()
-    
-    opts = Options()
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--window-size=1920,1080")
-    opts.add_argument("--headless")
-    driver = webdriver.Chrome(options=opts)
-    
+
     # Get player list: tournament-id (preferred) > field-file > Data Golf past-results
     if args.tournament_id:
         print(f"Loading field from tournament_players (tournament_id={args.tournament_id})...")
         players = load_players_from_tournament(args.tournament_id)
         if not players:
             print("No players found for that tournament. Import odds first via /admin/odds.")
-            driver.quit()
             return
         tournament = {"name": "Tournament Field", "date": ""}
         print(f"Players: {len(players)}\n")
     elif args.field_file:
         if not os.path.exists(args.field_file):
             print(f"Field file not found: {args.field_file}")
-            driver.quit()
             return
         players = load_players_from_field_file(args.field_file)
         tournament = {"name": "Field List", "date": ""}
@@ -333,77 +599,107 @@ def main():
             print(f"Using tournament: event_id={event_id}, year={year}")
         else:
             print("Auto-detecting most recent PGA tournament...")
-            result = get_latest_pga_tournament(driver)
+            result = get_latest_pga_tournament()
             if not result:
                 print("Could not detect a completed tournament. Use --event and --year or --field-file.")
-                driver.quit()
                 return
             event_id, year = result
             print(f"Detected: event_id={event_id}, year={year}")
-        
+
         # Fetch field from past-results
         print("Fetching field from past-results...")
-        field_result = fetch_field_from_past_results(driver, event_id, year)
+        field_result = fetch_field_from_past_results(event_id, year)
         if not field_result:
             print("No data found. Tournament may not be completed yet.")
-            driver.quit()
             return
-        
+
         players, tournament = field_result
         print(f"Tournament: {tournament['name']} ({tournament['date']})")
         print(f"Players: {len(players)}\n")
-    
+
+    by_name, by_last, name_by_id, fresh_skills = load_player_index()
+
+    # On reruns without an explicit tournament target, players whose skills
+    # were refreshed in the last 6 days have already been processed this week
+    skip_fresh = not (args.tournament_id or args.event)
+
+    assignments = []
+    skipped = 0
+    for name in players:
+        pid = get_player_id(name, by_name, by_last)
+        if not pid:
+            print(f"❌ Not in DB: {name}", flush=True)
+            continue
+        if skip_fresh and pid in fresh_skills:
+            skipped += 1
+            continue
+        assignments.append((name, pid))
+
+    if skipped:
+        print(f"Skipping {skipped} players with skills refreshed in the last 6 days")
+    if not assignments:
+        print("Nothing to scrape.")
+        return
+
+    workers = max(1, min(args.workers, len(assignments)))
+    chunks = [assignments[i::workers] for i in range(workers)]
+
     tourn_ok = 0
     skills_ok = 0
-    
+    done = 0
+    pending_records = []
+    pending_skills = []
+
     try:
-        for i, name in enumerate(players):
-            print(f"[{i+1}/{len(players)}] {name}", end=" ", flush=True)
-            
-            pid = get_player_id(name)
-            if not pid:
-                print("- ❌ Not in DB", flush=True)
-                continue
-            
-            data = scrape_player(driver, name)
-            if not data:
-                print("- ⚠️ No data", flush=True)
-                continue
-            
-            # Tournament records
-            records = process_tournament_records(data.get("new_data", []), pid)
-            if records:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(scrape_worker, idx, chunk) for idx, chunk in enumerate(chunks)]
+            for fut in as_completed(futures):
                 try:
-                    supabase.table("historical_tournament_results").upsert(
-                        records,
-                        on_conflict="pga_player_id,tournament_name,tournament_date",
-                    ).execute()
-                    tourn_ok += 1
+                    worker_results = fut.result()
                 except Exception as e:
-                    if "on_conflict" in str(e).lower():
-                        supabase.table("historical_tournament_results").upsert(records).execute()
-                    tourn_ok += 1
-            
-            # Skills
-            skills = process_skills(data.get("reload_data"))
-            if skills:
-                supabase.table("pga_players").update(skills).eq("id", pid).execute()
-                skills_ok += 1
-            
-            status = []
-            if records:
-                status.append(f"T:{len(records)}")
-            if skills:
-                status.append(f"S:{skills.get('approach_overall')}")
-            print(f"- {' '.join(status)}" if status else "-", flush=True)
-            
-            time.sleep(1)
-    
+                    print(f"⚠️ Worker failed: {e}", flush=True)
+                    continue
+                for res in worker_results:
+                    done += 1
+                    print(f"[{done}/{len(assignments)}] {res['name']}", end=" ", flush=True)
+
+                    if not res["scraped"]:
+                        print("- ⚠️ No data", flush=True)
+                        continue
+
+                    # Accumulate writes; flushed in bulk every 25 players
+                    records = res["records"]
+                    if records:
+                        pending_records.extend(records)
+                        tourn_ok += 1
+
+                    skills = res["skills"]
+                    if skills:
+                        # name must ride along: it's NOT NULL, and Postgres
+                        # checks that on the proposed tuple before ON CONFLICT
+                        # resolution, so an id-only upsert payload is rejected
+                        pending_skills.append({
+                            "id": res["pid"],
+                            "name": name_by_id[res["pid"]],
+                            **skills,
+                        })
+                        skills_ok += 1
+
+                    status = []
+                    if records:
+                        status.append(f"T:{len(records)}")
+                    if skills:
+                        status.append(f"S:{skills.get('approach_overall')}")
+                    print(f"- {' '.join(status)}" if status else "-", flush=True)
+
+                    if done % 25 == 0:
+                        flush_writes(pending_records, pending_skills)
+
     except KeyboardInterrupt:
         print("\n\nStopped by user", flush=True)
     finally:
-        driver.quit()
-    
+        flush_writes(pending_records, pending_skills)
+
     print("\n" + "=" * 50)
     print("WEEKLY UPDATE COMPLETE")
     print("=" * 50)